@@ -1,111 +1,230 @@
+import ast
+import io
+import math
+import re
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, font as tkfont
+from concurrent.futures import Future
+from functools import lru_cache, reduce
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
 import sympy as sp
+from sympy.parsing.sympy_parser import (
+    parse_expr, standard_transformations, convert_xor, implicit_multiplication,
+)
+from sympy.polys.matrices import DomainMatrix
+from sympy.polys.polyerrors import CoercionFailed
+from sympy.printing.str import StrPrinter
 
-# -------------------- Degree trig functions --------------------
-def cosd(x):
-    return sp.cos(sp.pi * x / 180)
+# -------------------- Precompiled patterns --------------------
+# Input shorthand: T/t followed by digits -> theta, A/a followed by digits -> alpha
+_RE_SHORTHAND = re.compile(r'\b([TtAa])([0-9]*)\b')
+_SHORTHAND_NAMES = {"T": "theta", "t": "theta", "A": "alpha", "a": "alpha"}
+_RE_IDENT = re.compile(r'\b[a-zA-Z_]\w*\b')
+_SP_NAMES = frozenset(dir(sp))  # Names sympify already resolves (cos, pi, sqrt, ...)
+# sympify's own transformations (^ as power) plus implicit products such as 2x or 2 pi
+_TRANSFORMS = standard_transformations + (convert_xor, implicit_multiplication)
 
+# Matrix expressions: ^T (transpose) and ^-1 (inverse) on names and parentheses
+# One alternation covers name^T, name^-1, )^-1 and )^T, plus the chains left by an
+# earlier rewrite: .T^-1 and **(-1)^T (both the inverse transpose)
+_RE_MATRIX_OPS = re.compile(r'([TtMm]\d+)\^[Tt]|([TtMm]\d+)\^-1|\)\^-1|\)\^[Tt]|\.T\^-1|\*\*\(-1\)\^[Tt]')
 
-def sind(x):
-    return sp.sin(sp.pi * x / 180)
 
+def _rewrite_matrix_op(m):
+    """Python spelling of one ^T / ^-1 match of _RE_MATRIX_OPS"""
+    name_t, name_inv = m.group(1), m.group(2)
+    if name_t:
+        return f"({name_t}.T)"
+    if name_inv:
+        return f"({name_inv})**(-1)"
+    if m.group(0) == ".T^-1" or m.group(0).startswith("**"):
+        # (A^-1)^T == (A^T)^-1, and .T binds tighter than **
+        return ".T**(-1)"
+    if m.group(0).endswith("-1"):
+        return ")**(-1)"
+    return ").T"
 
+
+# Matrix text that may hold floats: a decimal point or an exponent
+_RE_FLOAT_MARK = re.compile(r'[.eE]')
+
+# IK target rotation: exactly nine comma-separated floats
+_FLOAT = r'\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*'
+_RE_ROT9 = re.compile(','.join([_FLOAT] * 9))
+
+# -------------------- DH transformation --------------------
+def degree_argument(angle):
+    """cos/sin argument of an angle in degrees: numeric parts scaled by pi/180, symbols kept as is
+
+    theta1 + 90 becomes theta1 + pi/2, so the joint symbols carry no pi/180 factor and
+    trigsimp works on plain cos(theta1). Numeric evaluation must therefore substitute
+    theta -> pi*theta/180 (see radians_substitution).
+    """
+    angle = sp.sympify(angle)
+    return sp.expand_mul((sp.pi * angle / 180).xreplace({s: 180 * s / sp.pi for s in angle.free_symbols}))
+
+
+def _degrees_value(val):
+    """Numeric value of a solved angle, left symbolic when it still depends on a symbol"""
+    return val.evalf() if val.is_number else val
+
+
+def radians_substitution(symbols):
+    """xreplace map turning degree-argument expressions into true functions of angles in degrees"""
+    return {s: sp.pi * s / 180 for s in symbols}
+
+
+@lru_cache(maxsize=1024)
 def mDH_deg(alpha, a, d, theta):
-    """Modified DH transformation matrix"""
-    return sp.Matrix([
-        [cosd(theta),               -sind(theta),                0,                        a],
-        [sind(theta)*cosd(alpha),    cosd(theta)*cosd(alpha),   -sind(alpha), -sind(alpha)*d],
-        [sind(theta)*sind(alpha),    cosd(theta)*sind(alpha),    cosd(alpha),  cosd(alpha)*d],
-        [0,                          0,                          0,                        1]
+    """Modified DH transformation matrix (alpha and theta in degrees), memoized per parameter tuple"""
+    theta_arg, alpha_arg = degree_argument(theta), degree_argument(alpha)
+    ct, st = sp.cos(theta_arg), sp.sin(theta_arg)
+    ca, sa = sp.cos(alpha_arg), sp.sin(alpha_arg)
+    return sp.ImmutableDenseMatrix([
+        [ct,       -st,        0,      a],
+        [st*ca,     ct*ca,    -sa,  -sa*d],
+        [st*sa,     ct*sa,     ca,   ca*d],
+        [0,         0,         0,      1]
+    ])
+
+
+def mDH_deg_numeric(alpha, a, d, theta):
+    """Modified DH transformation matrix for plain numeric parameters (float64 array)"""
+    ct, st = np.cos(np.radians(theta)), np.sin(np.radians(theta))
+    ca, sa = np.cos(np.radians(alpha)), np.sin(np.radians(alpha))
+    return np.array([
+        [ct,       -st,        0.0,    a],
+        [st*ca,     ct*ca,    -sa,  -sa*d],
+        [st*sa,     ct*sa,     ca,   ca*d],
+        [0.0,       0.0,       0.0,  1.0]
     ])
 
 
-def strip_pi_over_180(expr):
-    """Replace cos(pi*X/180) -> cos(X), sin(pi*X/180) -> sin(X) for display"""
-    X = sp.Wild('X')
-    expr2 = expr.replace(sp.cos(sp.pi*X/180), sp.cos(X))
-    expr2 = expr2.replace(sp.sin(sp.pi*X/180), sp.sin(X))
-    return expr2
+def _ring_chain_product(matrices):
+    """Chain product as a DomainMatrix over QQ[sin/cos atoms, symbols], or None if an entry does not fit"""
+    elements = [e for M in matrices for e in M]
+    if any(e.has(sp.Float) for e in elements):
+        return None  # The rational ring would turn 0.5 into 1/2 in the printed result
+    gens = set().union(*(e.atoms(sp.cos, sp.sin, sp.Symbol) for e in elements))
+    domain = sp.QQ[tuple(sorted(gens, key=sp.default_sort_key))] if gens else sp.QQ
+    try:
+        dms = [DomainMatrix([[domain.from_sympy(e) for e in row] for row in M.tolist()], M.shape, domain)
+               for M in matrices]
+    except (CoercionFailed, ValueError):
+        return None  # e.g. sqrt(2)/2 from a 45 degree twist
+    return reduce(DomainMatrix.matmul, dms).to_Matrix()
+
+
+def chain_product(matrices):
+    """Product of a chain of transforms, starting from the first link rather than eye(4)"""
+    matrices = list(matrices)
+    if not matrices:
+        return sp.eye(4)
+    # DH entries are polynomials in their trig atoms; sparse ring arithmetic beats generic Expr products
+    T = _ring_chain_product(matrices)
+    if T is not None:
+        return T
+    T = matrices[0]
+    for M in matrices[1:]:
+        T = T * M
+    return T
+
+
+def simplify_transform(T):
+    """Simplify a product of DH matrices (trig polynomial in the joint angles)"""
+    return integral_floats_to_ints(sp.trigsimp(sp.expand_trig(T)))
+
+
+def integral_floats_to_ints(expr):
+    """expr with 1.0, -1.0, 2.0, ... replaced by Integers (0.5 stays a Float)"""
+    # With a Float anywhere in a chain, simplification leaves 1.0*L2-style coefficients
+    integral = {f: sp.Integer(int(f)) for f in expr.atoms(sp.Float) if float(f).is_integer()}
+    return expr.xreplace(integral) if integral else expr
+
+
+class CSPrinter(StrPrinter):
+    """Compact display printer: cos/sin -> C/S with arguments in degrees, theta/alpha -> Greek"""
+    
+    def _degree_arg(self, arg):
+        # Symbols already stand for degrees, so only the pi in numeric offsets is converted:
+        # cos(theta1 + pi/4) is shown as C(θ1 + 45), cos(pi*x/180) as C(x)
+        return arg.xreplace({sp.pi: 180})
+    
+    def _print_cos(self, expr):
+        return "C(%s)" % self._print(self._degree_arg(expr.args[0]))
+    
+    def _print_sin(self, expr):
+        return "S(%s)" % self._print(self._degree_arg(expr.args[0]))
+    
+    def _print_Symbol(self, expr):
+        name = super()._print_Symbol(expr)
+        # Fixed words, so plain str.replace rather than regex substitution
+        return name.replace('theta', 'θ').replace('alpha', 'α')
+
+
+def format_number(x):
+    """Display string of a float, with round-off noise such as cos(90°) ~ 6e-17 shown as 0"""
+    if abs(x) < 1e-12:
+        x = 0.0
+    return f"{x:.6g}"
+
+
+_CS_PRINTER = CSPrinter()
+
 
+@lru_cache(maxsize=4096)
+def _format_sympy(expr):
+    """Compact C/S string of a SymPy expression, memoized per expression"""
+    return _CS_PRINTER.doprint(expr)
 
-def format_with_CS(expr_str):
-    """Replace cos/sin with C/S and theta/alpha with Greek symbols for compact display"""
-    import re
-    result = re.sub(r'cos\(', 'C(', expr_str)
-    result = re.sub(r'sin\(', 'S(', result)
-    # Replace theta and alpha with Greek symbols
-    result = re.sub(r'theta', 'θ', result)
-    result = re.sub(r'alpha', 'α', result)
-    return result
+
+def format_expr(expr):
+    """Display string of a single expression in compact C/S notation"""
+    # Floats are dispatched before the cache: Float(0.5) == 0.5 with equal hashes,
+    # so a shared cache would print NumPy results with SymPy's Float formatting
+    if isinstance(expr, (float, np.floating)):
+        return format_number(expr)
+    return _format_sympy(expr)
+
+
+@lru_cache(maxsize=256)
+def _matrix_line_template(col_widths):
+    """Format string for one matrix line: centering padding, left bracket, right-aligned cells, right bracket"""
+    # Every line has the same width, so the centering padding (assume ~80 char output)
+    # and the cell alignment go into one template shared by all matrices with these widths
+    width = 6 + sum(col_widths) + 3 * (len(col_widths) - 1)
+    padding = ' ' * max(0, (80 - width) // 2)
+    return padding + '{}  ' + '   '.join(f'{{:>{w}}}' for w in col_widths) + '  {}'
 
 
 def format_matrix_clean(M):
     """Custom matrix formatter with clean bracket visualization and center alignment"""
-    import re
-    
-    Md = M.applyfunc(strip_pi_over_180)
-    # Convert to strings without pretty printing first
-    rows = []
-    
-    for i in range(Md.shape[0]):
-        row_items = []
-        for j in range(Md.shape[1]):
-            element = Md[i, j]
-            # Convert to string and apply formatting
-            elem_str = str(element)
-            elem_str = format_with_CS(elem_str)
-            row_items.append(elem_str)
-        rows.append(row_items)
+    # Convert each element to its compact display string in a single printer pass
+    rows = [[format_expr(x) for x in row] for row in M.tolist()]
     
     # Find max width for each column
-    col_widths = []
-    for j in range(Md.shape[1]):
-        max_width = max(len(rows[i][j]) for i in range(Md.shape[0]))
-        col_widths.append(max_width)
-    
-    # Build formatted matrix
-    lines = []
-    for i, row in enumerate(rows):
-        # Format each element with padding
-        formatted_items = []
-        for j, item in enumerate(row):
-            formatted_items.append(item.rjust(col_widths[j]))
-        
-        # Add brackets
-        if i == 0:
-            bracket_left = '⎡'
-            bracket_right = '⎤'
-        elif i == len(rows) - 1:
-            bracket_left = '⎣'
-            bracket_right = '⎦'
-        else:
-            bracket_left = '⎢'
-            bracket_right = '⎥'
-        
-        line = bracket_left + '  ' + '   '.join(formatted_items) + '  ' + bracket_right
-        # Center the matrix line with padding (assume ~80 char width for output)
-        padding = max(0, (80 - len(line)) // 2)
-        line = ' ' * padding + line
-        lines.append(line)
+    col_widths = [max(map(len, col)) for col in zip(*rows)]
+    
+    line_template = _matrix_line_template(tuple(col_widths))
     
-    return '\n'.join(lines)
+    # Bracket pieces: top, middle rows, bottom (a single row keeps the top pair)
+    brackets = [('⎢', '⎥')] * len(rows)
+    brackets[-1] = ('⎣', '⎦')
+    brackets[0] = ('⎡', '⎤')
+    
+    return '\n'.join([line_template.format(left, *row, right) for (left, right), row in zip(brackets, rows)])
 
 
-def add_matrix_spacing(matrix_str):
-    """Add spacing between matrix rows for better readability"""
-    lines = matrix_str.split('\n')
-    # Find bracket lines and content lines
-    result_lines = []
-    for i, line in enumerate(lines):
-        result_lines.append(line)
-        # Add spacing between content rows (not between bracket rows)
-        if i < len(lines) - 1 and line.strip() and not line.strip().startswith('[') and not line.strip().startswith(']'):
-            # Check if next line is not a bracket line
-            if lines[i+1].strip() and not lines[i+1].strip().startswith('[') and not lines[i+1].strip().startswith(']'):
-                result_lines.append('')  # Add blank line for spacing
-    
-    return '\n'.join(result_lines)
+@lru_cache(maxsize=64)
+def cse_display(M):
+    """Common subexpressions of an immutable matrix M: (replacements, reduced matrix), memoized on M"""
+    symbols = sp.numbered_symbols('x', start=1, exclude=M.free_symbols)
+    reps, (M2,) = sp.cse(M, symbols=symbols)
+    # Cached, so the result is handed out in immutable form
+    return tuple(reps), M2.as_immutable()
 
 
 def pretty_matrix(M):
@@ -118,6 +237,20 @@ def pretty_vector(v):
     return format_matrix_clean(v)
 
 
+def pretty_cse(M):
+    """Pretty print matrix as 'x1 = ...' shared subexpressions followed by the reduced matrix"""
+    if not isinstance(M, sp.MatrixBase):
+        return pretty_matrix(M)
+    reps, M2 = cse_display(M.as_immutable())
+    lines = [f"  {format_expr(sym)} = {format_expr(val)}" for sym, val in reps]
+    return "\n".join(lines + [pretty_matrix(M2)])
+
+
+def _expand_shorthand(s):
+    """Expand T/t/A/a (optionally followed by digits) to theta/alpha in one regex pass"""
+    return _RE_SHORTHAND.sub(lambda m: _SHORTHAND_NAMES[m.group(1)] + m.group(2), s)
+
+
 def safe_sympify(s, locals_dict=None):
     """Parse string as sympy expression, treating undefined names as symbols"""
     if locals_dict is None:
@@ -127,29 +260,388 @@ def safe_sympify(s, locals_dict=None):
     if s == "":
         raise ValueError("Empty input.")
     
-    import re
-    # Replace shorthand notation: T/t followed by digits -> theta, A/a followed by digits -> alpha
-    s_expanded = re.sub(r'\bT([0-9]*)\b', r'theta\1', s)       # T or T1, T2, etc.
-    s_expanded = re.sub(r'\bt([0-9]*)\b', r'theta\1', s_expanded)  # t or t1, t2, etc.
-    s_expanded = re.sub(r'\bA([0-9]*)\b', r'alpha\1', s_expanded)  # A or A1, A2, etc.
-    s_expanded = re.sub(r'\ba([0-9]*)\b', r'alpha\1', s_expanded)  # a or a1, a2, etc.
+    s_expanded = _expand_shorthand(s)
     
+    # Declare undefined names as symbols up front so the expression is parsed exactly once
+    undefined = set(_RE_IDENT.findall(s_expanded)).difference(locals_dict, _SP_NAMES)
+    extended_locals = dict(locals_dict)
+    for name in undefined:
+        extended_locals[name] = sp.Symbol(name)
+    return parse_expr(s_expanded, local_dict=extended_locals, transformations=_TRANSFORMS)
+
+
+@lru_cache(maxsize=4096)
+def _cached_sympify(s):
+    """safe_sympify of a raw entry string, parsed once per distinct text"""
+    return safe_sympify(s)
+
+
+@lru_cache(maxsize=512)
+def _mDH_cached(alpha_s, a_s, d_s, theta_s):
+    """mDH_deg built straight from the raw entry strings, cached per parameter row"""
+    return mDH_deg(_cached_sympify(alpha_s), _cached_sympify(a_s), _cached_sympify(d_s), _cached_sympify(theta_s))
+
+
+def _dh_rows_sympy(rows):
+    """Entry-string DH rows as a hashable tuple of SymPy (alpha, a, d, theta) rows"""
+    return tuple(tuple(_cached_sympify(s) for s in row) for row in rows)
+
+
+@lru_cache(maxsize=256)
+def _dh_chain(dh_params):
+    """Unsimplified product of the links of dh_params (tuple of SymPy rows); prefixes are shared"""
+    if not dh_params:
+        return sp.ImmutableMatrix(sp.eye(4))
+    link = mDH_deg(*dh_params[-1])
+    if len(dh_params) == 1:
+        return link
+    # Editing the last rows only rebuilds the product from the first changed row onward
+    return chain_product([_dh_chain(dh_params[:-1]), link]).as_immutable()
+
+
+@lru_cache(maxsize=32)
+def _dh_forward(dh_params):
+    """Simplified forward kinematics of dh_params, so recalculating an unchanged table is free"""
+    return simplify_transform(_dh_chain(dh_params)).as_immutable()
+
+
+@lru_cache(maxsize=32)
+def _ik_forward(dh_params, deep):
+    """T0N of dh_params with the entries IK uses (first two rows and pz) simplified"""
+    T0N = _dh_chain(dh_params)
+    # The rest of T0N is left as multiplied
+    simplify = (lambda M: integral_floats_to_ints(sp.simplify(M))) if deep else simplify_transform
+    T_used = sp.Matrix(T0N)
+    T_used[:2, :] = simplify(T0N[:2, :])
+    T_used[2, 3] = simplify(T0N[2, 3])
+    return T_used.as_immutable()
+
+
+def numeric_dh_rows(rows):
+    """Float DH parameters when every entry of every row is a plain number, else None"""
     try:
-        return sp.sympify(s_expanded, locals=locals_dict)
-    except:
-        undefined = []
-        for match in re.finditer(r'\b[a-zA-Z_]\w*\b', s_expanded):
-            name = match.group()
-            if name not in locals_dict and name not in dir(sp):
-                undefined.append(name)
-        
-        if undefined:
-            extended_locals = dict(locals_dict)
-            for name in set(undefined):
-                extended_locals[name] = sp.Symbol(name, positive=True)
-            return sp.sympify(s_expanded, locals=extended_locals)
+        return [[float(_cached_sympify(s)) for s in row] for row in rows]
+    except TypeError:
+        return None
+
+
+# -------------------- Matrix expressions --------------------
+def make_matrix(matrix_data):
+    """Float ndarray when the entries are floats (and integers), otherwise an exact sp.Matrix"""
+    # Integer-only and Rational entries such as 1/3 stay exact in an sp.Matrix, so
+    # 1234567 or an inverse of 3/2 is not rounded to 6 significant digits
+    entries = [sp.sympify(v) for row in matrix_data for v in row]
+    if any(v.is_Float for v in entries) and all(v.is_Integer or v.is_Float for v in entries):
+        return np.array(matrix_data, dtype=float)
+    return sp.Matrix(matrix_data)
+
+
+def _as_sympy(x):
+    """sp.Matrix of an ndarray operand, anything else unchanged"""
+    if not isinstance(x, np.ndarray):
+        return x
+    # Integral values become Integers, so an identity times x prints x rather than 1.0*x
+    return sp.Matrix(*x.shape, [sp.Integer(int(v)) if v.is_integer() else sp.Float(v) for v in x.flat])
+
+
+# NumPy counterparts of the matrix operators. Each returns NotImplemented for operand
+# kinds sp.Matrix would reject (M + 1, M / M, shape mismatches), so _apply_binop falls
+# back to sp.Matrix and raises its error instead of broadcasting element-wise.
+def _both_arrays(x, y):
+    return isinstance(x, np.ndarray) and isinstance(y, np.ndarray)
+
+
+def _numpy_add(x, y):
+    """Sum of two same-shape arrays"""
+    return x + y if _both_arrays(x, y) and x.shape == y.shape else NotImplemented
+
+
+def _numpy_sub(x, y):
+    """Difference of two same-shape arrays"""
+    return x - y if _both_arrays(x, y) and x.shape == y.shape else NotImplemented
+
+
+def _numpy_mul(x, y):
+    """Matrix product of two arrays, plain scaling otherwise"""
+    if _both_arrays(x, y):
+        return x @ y if x.shape[1] == y.shape[0] else NotImplemented
+    return x * y
+
+
+def _numpy_matmul(x, y):
+    """Matrix product of two arrays"""
+    return x @ y if _both_arrays(x, y) and x.shape[1] == y.shape[0] else NotImplemented
+
+
+def _numpy_div(x, y):
+    """Array divided by a scalar"""
+    return x / y if isinstance(x, np.ndarray) and not isinstance(y, np.ndarray) else NotImplemented
+
+
+def _numpy_pow(x, y):
+    """Integer power of a square array; M**-1 is the inverse"""
+    if not isinstance(x, np.ndarray) or isinstance(y, np.ndarray) or x.shape[0] != x.shape[1]:
+        return NotImplemented
+    if int(y) != y:
+        raise ValueError(f"Matrix power must be an integer, got {y}")
+    return np.linalg.matrix_power(x, int(y))
+
+
+def _apply_binop(op, numpy_op, x, y):
+    """op(x, y); numpy_op when an operand is an ndarray, sp.Matrix promotion when mixed or unsupported"""
+    if isinstance(x, np.ndarray) or isinstance(y, np.ndarray):
+        if not (isinstance(x, sp.MatrixBase) or isinstance(y, sp.MatrixBase)):
+            result = numpy_op(x, y)
+            if result is not NotImplemented:
+                return result
+        x, y = _as_sympy(x), _as_sympy(y)
+    return op(x, y)
+
+
+class MatrixExprCompiler(ast.NodeVisitor):
+    """Compile a parsed matrix expression into a straight-line list of steps.
+    
+    Only names, numbers, + - * / @ **, unary minus and .T are allowed. Each step is
+    (fn, argument step indices) and each distinct subexpression is one step, so T01*T12
+    in (T01*T12)*(T01*T12)^T is evaluated once. Numeric matrices are ndarrays and keep
+    the sp.Matrix meaning of * and **; mixed with a symbolic matrix they are promoted
+    to sp.Matrix.
+    """
+    
+    _BINOPS = {
+        ast.Add: lambda x, y: x + y,
+        ast.Sub: lambda x, y: x - y,
+        ast.Mult: lambda x, y: x * y,
+        ast.MatMult: lambda x, y: x @ y,
+        ast.Div: lambda x, y: x / y,
+        ast.Pow: lambda x, y: x ** y,
+    }
+    _NUMPY_BINOPS = {
+        ast.Add: _numpy_add,
+        ast.Sub: _numpy_sub,
+        ast.Mult: _numpy_mul,
+        ast.MatMult: _numpy_matmul,
+        ast.Div: _numpy_div,
+        ast.Pow: _numpy_pow,
+    }
+    
+    def __init__(self):
+        self.steps = []
+        self.slots = {}  # ast.dump of a subtree -> index of its step
+    
+    def visit(self, node):
+        key = ast.dump(node)
+        if key not in self.slots:
+            fn, args = super().visit(node)
+            self.steps.append((fn, args))
+            self.slots[key] = len(self.steps) - 1
+        return self.slots[key]
+    
+    def visit_Name(self, node):
+        name = node.id
+        
+        def load(names):
+            if name not in names:
+                raise NameError(f"name '{name}' is not defined")
+            return names[name]
+        return load, ()
+    
+    def visit_Constant(self, node):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Unsupported constant: {value!r}")
+        return (lambda names: value), ()
+    
+    def visit_BinOp(self, node):
+        op = self._BINOPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        numpy_op = self._NUMPY_BINOPS[type(node.op)]
+        return (lambda names, x, y: _apply_binop(op, numpy_op, x, y)), (self.visit(node.left), self.visit(node.right))
+    
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.USub):
+            return (lambda names, x: -x), (self.visit(node.operand),)
+        if isinstance(node.op, ast.UAdd):
+            return (lambda names, x: x), (self.visit(node.operand),)
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    
+    def visit_Attribute(self, node):
+        if node.attr != "T":
+            raise ValueError(f"Unsupported attribute: .{node.attr}")
+        return (lambda names, x: x.T), (self.visit(node.value),)
+    
+    def generic_visit(self, node):
+        raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+
+
+def rewrite_matrix_ops(expr):
+    """Python spelling of the ^T / ^-1 operators in a matrix expression
+
+    T01^T -> (T01.T), M0^-1 -> (M0)**(-1), (expr)^-1 -> (expr)**(-1), (expr)^T -> (expr).T.
+    A rewrite can end in ")" that the next operator applies to, so passes repeat until
+    nothing changes:
+
+    >>> rewrite_matrix_ops("M0^T^-1")
+    '(M0.T)**(-1)'
+    >>> rewrite_matrix_ops("(T01*T12)^T*M1^-1")
+    '(T01*T12).T*(M1)**(-1)'
+    >>> rewrite_matrix_ops("(M0*M1)^T^-1")
+    '(M0*M1).T**(-1)'
+    >>> rewrite_matrix_ops("M0^-1^T")
+    '(M0).T**(-1)'
+    """
+    while True:
+        rewritten = _RE_MATRIX_OPS.sub(_rewrite_matrix_op, expr)
+        if rewritten == expr:
+            return expr
+        expr = rewritten
+
+
+@lru_cache(maxsize=256)
+def compile_matrix_expression(expr):
+    """Steps of a matrix expression with ^T / ^-1, built once per expression string"""
+    expr_proc = rewrite_matrix_ops(expr)
+    compiler = MatrixExprCompiler()
+    compiler.visit(ast.parse(expr_proc, mode="eval").body)
+    return tuple(compiler.steps)
+
+
+def run_matrix_expression(steps, names):
+    """Execute compiled steps against a dict of named matrices; the last step is the result"""
+    values = []
+    for fn, args in steps:
+        values.append(fn(names, *[values[i] for i in args]))
+    return values[-1]
+
+
+# -------------------- Numeric IK --------------------
+# Starting joint angles (deg, same for every joint) tried in turn by solve_numeric_ik
+_IK_STARTS = (0.0, 30.0, -60.0, 90.0, 150.0)
+
+
+def wrap_degrees(q):
+    """Angle(s) in degrees mapped to (-180, 180]"""
+    return -((180.0 - q) % 360.0) + 180.0
+
+
+def levenberg_marquardt(F_fn, J_fn, q0, tol=1e-10, max_iter=200):
+    """Minimize |F(q)|^2 from q0 with damped Gauss-Newton steps, returns (q, |F(q)|)"""
+    q = np.array(q0, dtype=float)
+    f = F_fn(q)
+    cost = f @ f
+    lam = 1e-3
+    for _ in range(max_iter):
+        if cost < tol * tol:
+            break
+        J = J_fn(q)
+        JtJ = J.T @ J
+        # Marquardt scaling; the floor keeps joints that do not move the target solvable
+        D = np.diag(np.maximum(np.diag(JtJ), 1e-9))
+        step = np.linalg.solve(JtJ + lam * D, -(J.T @ f))
+        q_new = q + step
+        f_new = F_fn(q_new)
+        cost_new = f_new @ f_new
+        if cost_new < cost:
+            q, f, cost = q_new, f_new, cost_new
+            lam = max(lam / 3, 1e-12)
         else:
-            raise
+            lam *= 4
+            if lam > 1e12:
+                break
+        if np.max(np.abs(step)) < 1e-12:
+            break
+    return q, float(np.sqrt(cost))
+
+
+@lru_cache(maxsize=64)
+def _ik_position_functions(position, theta_vars):
+    """Lambdified position and Jacobian of an FK position (joint angles in degrees), shared by every target"""
+    to_radians = radians_substitution(theta_vars)
+    position = [e.xreplace(to_radians) for e in position]
+    P_fn = sp.lambdify(theta_vars, list(position), "numpy", cse=True)
+    J_fn = sp.lambdify(theta_vars, sp.Matrix(position).jacobian(theta_vars), "numpy", cse=True)
+    return P_fn, J_fn
+
+
+def solve_numeric_ik(position, target, theta_vars, tol=1e-9):
+    """Joint angles (deg) placing the position expressions at target, or None if no start converges"""
+    P_fn, J_fn = _ik_position_functions(tuple(position), tuple(theta_vars))
+    target = np.asarray(target, dtype=float)
+    F = lambda q: np.array(P_fn(*q), dtype=float) - target
+    J = lambda q: np.array(J_fn(*q), dtype=float)
+    for start in _IK_STARTS:
+        q, err = levenberg_marquardt(F, J, np.full(len(theta_vars), start))
+        if err < tol:
+            return wrap_degrees(q), err
+    return None
+
+
+def planar_ik(dh_params, target, target_R, tol=1e-9):
+    """Closed-form IK of a planar 2- or 3-link arm (every alpha and d zero, numeric a).
+    
+    Returns a list of {theta: degrees} solutions, or None when the DH table does
+    not have that shape. With modified DH the last joint does not move the frame
+    origin, so it is set from the target heading atan2(R10, R00).
+    """
+    if len(dh_params) not in (2, 3):
+        return None
+    if not all(alpha == 0 and d == 0 and a.is_Number for alpha, a, d, _ in dh_params):
+        return None
+    lengths = [float(a) for _, a, _, _ in dh_params]
+    thetas = [theta for *_, theta in dh_params]
+    
+    px, py, pz = target
+    x, y = px - lengths[0], py
+    if abs(pz) > tol:
+        return []
+    
+    if len(dh_params) == 2:
+        L = lengths[1]
+        if L == 0:
+            return None
+        if abs(math.hypot(x, y) - L) > tol:
+            return []
+        branches = [(math.atan2(y, x),)]
+    else:
+        L1, L2 = lengths[1:]
+        if L1 == 0 or L2 == 0:
+            return None
+        # Law of cosines for the elbow, then the shoulder from the two triangle angles
+        c2 = (x * x + y * y - L1 * L1 - L2 * L2) / (2 * L1 * L2)
+        if abs(c2) > 1 + tol:
+            return []
+        t2 = math.acos(max(-1.0, min(1.0, c2)))
+        elbows = (t2, -t2) if 0 < t2 < math.pi else (t2,)
+        branches = [(math.atan2(y, x) - math.atan2(L2 * math.sin(q2), L1 + L2 * math.cos(q2)), q2)
+                    for q2 in elbows]
+    
+    heading = math.atan2(float(target_R[1, 0]), float(target_R[0, 0]))
+    return [
+        {theta: wrap_degrees(math.degrees(q)) for theta, q in zip(thetas, qs + (heading - sum(qs),))}
+        for qs in branches
+    ]
+
+
+# -------------------- Background jobs --------------------
+def run_in_background(fn, *args, lock):
+    """Run fn(*args) on a daemon thread holding lock, returning a Future of its result
+
+    sp.solve and simplify cannot be interrupted, so a job may still be running when the
+    window closes; a daemon thread does not keep the process alive for it. The lock runs
+    jobs of one tab in order, one at a time.
+    """
+    future = Future()
+    
+    def run():
+        with lock:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 # -------------------- Main GUI Application --------------------
@@ -159,6 +651,13 @@ class DHCalculator(tk.Tk):
         self.title("DH Robot Kinematics Calculator - Designed By Eng.Emad")
         self.geometry("1500x850")
         
+        # Shared named fonts: Tk resolves each once instead of once per widget
+        self.font_normal = tkfont.Font(self, family="Arial", size=10)
+        self.font_bold = tkfont.Font(self, family="Arial", size=10, weight="bold")
+        self.font_small = tkfont.Font(self, family="Arial", size=9)
+        self.font_mono = tkfont.Font(self, family="Courier New", size=10)
+        self.font_mono_bold = tkfont.Font(self, family="Courier New", size=10, weight="bold")
+        
         self._build_ui()
     
     def _build_ui(self):
@@ -185,9 +684,10 @@ class DHCalculator(tk.Tk):
     # ============== TAB 1: INTERACTIVE MODE ==============
     def _build_interactive_tab(self, parent):
         """Interactive mode - add matrices individually"""
-        self.int_params = []
-        self.int_matrices = []
+        self.int_params = []  # Parameter strings per matrix; matrices are built on demand
         self.int_names = {}
+        self.int_fk_cache = None  # Forward kinematics product, rebuilt lazily after edits
+        self.int_prefix = []  # Unsimplified T0..T(i+1) products; an edit drops those from its matrix on
         
         # Top buttons
         top = ttk.Frame(parent)
@@ -210,7 +710,10 @@ class DHCalculator(tk.Tk):
         list_frame = ttk.LabelFrame(left, text="Matrices", padding=10)
         list_frame.pack(fill="y", padx=0, pady=0)
         
-        self.int_listbox = tk.Listbox(list_frame, height=16, width=15, font=("Courier", 10, "bold"))
+        # Item labels live in a list variable so a re-label is one Tk call
+        self.int_list_var = tk.StringVar(value=())
+        self.int_listbox = tk.Listbox(list_frame, listvariable=self.int_list_var, height=16, width=15,
+                                      font=self.font_mono_bold)
         self.int_listbox.pack(fill="y", expand=False)
         self.int_listbox.bind("<<ListboxSelect>>", self._int_on_select)
         
@@ -218,7 +721,7 @@ class DHCalculator(tk.Tk):
         editor = ttk.LabelFrame(left, text="Edit Parameters", padding=10)
         editor.pack(fill="x", pady=15)
         
-        self.int_sel_label = ttk.Label(editor, text="Selected: -", font=("Arial", 10, "bold"))
+        self.int_sel_label = ttk.Label(editor, text="Selected: -", font=self.font_bold)
         self.int_sel_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
         
         ttk.Label(editor, text="α:").grid(row=1, column=0, sticky="e", padx=4, pady=5)
@@ -226,10 +729,10 @@ class DHCalculator(tk.Tk):
         ttk.Label(editor, text="d:").grid(row=3, column=0, sticky="e", padx=4, pady=5)
         ttk.Label(editor, text="θ:").grid(row=4, column=0, sticky="e", padx=4, pady=5)
         
-        self.int_alpha_entry = ttk.Entry(editor, width=15, font=("Arial", 10))
-        self.int_a_entry = ttk.Entry(editor, width=15, font=("Arial", 10))
-        self.int_d_entry = ttk.Entry(editor, width=15, font=("Arial", 10))
-        self.int_theta_entry = ttk.Entry(editor, width=15, font=("Arial", 10))
+        self.int_alpha_entry = ttk.Entry(editor, width=15, font=self.font_normal)
+        self.int_a_entry = ttk.Entry(editor, width=15, font=self.font_normal)
+        self.int_d_entry = ttk.Entry(editor, width=15, font=self.font_normal)
+        self.int_theta_entry = ttk.Entry(editor, width=15, font=self.font_normal)
         
         self.int_alpha_entry.grid(row=1, column=1, pady=5, padx=4)
         self.int_a_entry.grid(row=2, column=1, pady=5, padx=4)
@@ -253,12 +756,12 @@ class DHCalculator(tk.Tk):
         ttk.Radiobutton(ops, text="4: Rotation Matrix", variable=self.int_op_choice, value="4").pack(anchor="w", pady=3)
         
         # Format instructions
-        ttk.Label(ops, text="Format: T01*T12, T01^T (transpose), T01^-1 (inverse), etc ", font=("Arial", 9), foreground="gray").pack(anchor="w", pady=(10, 0))
+        ttk.Label(ops, text="Format: T01*T12, T01^T (transpose), T01^-1 (inverse), etc ", font=self.font_small, foreground="gray").pack(anchor="w", pady=(10, 0))
         
         expr_frame = ttk.Frame(ops)
         expr_frame.pack(fill="x", pady=10)
         ttk.Label(expr_frame, text="Expression:").pack(anchor="w")
-        self.int_expr_entry = ttk.Entry(expr_frame, width=50, font=("Arial", 10))
+        self.int_expr_entry = ttk.Entry(expr_frame, width=50, font=self.font_normal)
         self.int_expr_entry.pack(fill="x", pady=(0, 5))
         ttk.Button(expr_frame, text="Run Operation", command=self._int_run_op).pack(anchor="e")
         
@@ -271,7 +774,7 @@ class DHCalculator(tk.Tk):
         clear_frame.pack(fill="x", pady=(0, 5))
         ttk.Button(clear_frame, text="Clear Results", command=lambda: self.int_output.delete("1.0", "end")).pack(anchor="e")
         
-        self.int_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=("Courier New", 10))
+        self.int_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=self.font_mono)
         self.int_output.pack(fill="both", expand=True)
         # Configure center alignment tag
         self.int_output.tag_configure("center", justify="center")
@@ -280,9 +783,9 @@ class DHCalculator(tk.Tk):
     
     def _int_add_matrix(self):
         """Add new matrix in interactive mode"""
-        idx = len(self.int_matrices)
+        idx = len(self.int_params)
         self.int_params.append({"alpha": "", "a": "", "d": "", "theta": ""})
-        self.int_matrices.append(sp.eye(4))
+        self.int_fk_cache = None
         
         name = f"T{idx}{idx+1}"
         self.int_listbox.insert("end", name)
@@ -315,15 +818,12 @@ class DHCalculator(tk.Tk):
         idx = int(sel[0])
         
         try:
-            alpha = safe_sympify(self.int_alpha_entry.get())
-            a = safe_sympify(self.int_a_entry.get())
-            d = safe_sympify(self.int_d_entry.get())
-            theta = safe_sympify(self.int_theta_entry.get())
-            
-            Ti = mDH_deg(alpha, a, d, theta)
-            Ti = sp.simplify(Ti)
+            # Building the matrix validates the entries before they are stored
+            Ti = _mDH_cached(self.int_alpha_entry.get(), self.int_a_entry.get(),
+                             self.int_d_entry.get(), self.int_theta_entry.get())
             
-            self.int_matrices[idx] = Ti
+            self.int_fk_cache = None
+            del self.int_prefix[idx:]
             self.int_params[idx] = {"alpha": self.int_alpha_entry.get(), "a": self.int_a_entry.get(), 
                                    "d": self.int_d_entry.get(), "theta": self.int_theta_entry.get()}
             
@@ -338,7 +838,7 @@ class DHCalculator(tk.Tk):
         if not sel:
             return
         idx = int(sel[0])
-        self._int_write_output(f"\nT{idx}{idx+1} =\n{pretty_matrix(self.int_matrices[idx])}\n")
+        self._int_write_output(f"\nT{idx}{idx+1} =\n{pretty_matrix(self._int_matrix(idx))}\n")
     
     def _int_delete(self):
         """Delete selected matrix"""
@@ -347,13 +847,11 @@ class DHCalculator(tk.Tk):
             return
         idx = int(sel[0])
         
-        self.int_matrices.pop(idx)
         self.int_params.pop(idx)
-        self.int_listbox.delete(idx)
-        
-        self.int_listbox.delete(0, "end")
-        for i in range(len(self.int_matrices)):
-            self.int_listbox.insert("end", f"T{i}{i+1}")
+        self.int_fk_cache = None
+        del self.int_prefix[idx:]
+        # Labels are positional, so the whole list is set at once
+        self.int_list_var.set(tuple(f"T{i}{i+1}" for i in range(len(self.int_params))))
         
         for entry in (self.int_alpha_entry, self.int_a_entry, self.int_d_entry, self.int_theta_entry):
             entry.delete(0, "end")
@@ -361,8 +859,9 @@ class DHCalculator(tk.Tk):
     
     def _int_reset_all(self):
         """Reset all in interactive mode"""
-        self.int_matrices = []
         self.int_params = []
+        self.int_fk_cache = None
+        self.int_prefix = []
         self.int_listbox.delete(0, "end")
         for entry in (self.int_alpha_entry, self.int_a_entry, self.int_d_entry, self.int_theta_entry):
             entry.delete(0, "end")
@@ -371,11 +870,12 @@ class DHCalculator(tk.Tk):
     
     def _int_run_op(self):
         """Run operation in interactive mode"""
-        if not self.int_matrices:
+        if not self.int_params:
             messagebox.showwarning("No matrices", "Add matrices first")
             return
         
         choice = self.int_op_choice.get()
+        buf = []  # Collected output, written to the widget in one insert
         
         try:
             if choice == "1":
@@ -384,58 +884,64 @@ class DHCalculator(tk.Tk):
                     return
                 
                 # Create matrix names dict
-                names = {f"T{i}{i+1}": self.int_matrices[i] for i in range(len(self.int_matrices))}
+                names = {f"T{i}{i+1}": self._int_matrix(i) for i in range(len(self.int_params))}
                 names["I"] = sp.eye(4)
                 
                 # Process expression with transpose and inverse operators
                 result = self._process_matrix_expression(expr, names)
                 
-                self._int_write_output(f"\n{expr} =\n")
+                buf.append(f"\n{expr} =\n")
                 if isinstance(result, sp.MatrixBase):
-                    self._int_write_output(pretty_matrix(sp.simplify(result)) + "\n")
+                    buf.append(pretty_matrix(sp.simplify(result)) + "\n")
                 else:
-                    self._int_write_output(f"{result}\n")
+                    buf.append(f"{result}\n")
             
             elif choice == "2":
-                Tf = sp.eye(4)
-                for M in self.int_matrices:
-                    Tf = sp.simplify(Tf * M)
-                self._int_write_output("\nForward Kinematics T0N =\n")
-                self._int_write_output(pretty_matrix(Tf) + "\n")
+                Tf = self._int_get_fk()
+                buf.append("\nForward Kinematics T0N =\n")
+                buf.append(pretty_cse(Tf) + "\n")
             
             elif choice == "3":
-                Tf = sp.eye(4)
-                for M in self.int_matrices:
-                    Tf = sp.simplify(Tf * M)
-                self._int_write_output("\nPosition Vector p =\n")
-                self._int_write_output(pretty_vector(Tf[:3, 3]) + "\n")
+                Tf = self._int_get_fk()
+                buf.append("\nPosition Vector p =\n")
+                buf.append(pretty_vector(Tf[:3, 3:]) + "\n")
             
             elif choice == "4":
-                Tf = sp.eye(4)
-                for M in self.int_matrices:
-                    Tf = sp.simplify(Tf * M)
-                self._int_write_output("\nRotation Matrix R =\n")
-                self._int_write_output(pretty_matrix(Tf[:3, :3]) + "\n")
+                Tf = self._int_get_fk()
+                buf.append("\nRotation Matrix R =\n")
+                buf.append(pretty_matrix(Tf[:3, :3]) + "\n")
+            
+            self._int_write_output("".join(buf))
         except Exception as e:
             messagebox.showerror("Error", f"Operation error: {e}")
     
+    def _int_matrix(self, idx):
+        """DH matrix of interactive entry idx, built from its parameter strings when needed"""
+        p = self.int_params[idx]
+        if not any(p.values()):
+            # Newly added matrix whose parameters have not been set yet
+            return sp.eye(4)
+        return _mDH_cached(p["alpha"], p["a"], p["d"], p["theta"])
+    
+    def _int_get_fk(self):
+        """Forward kinematics T0N of the interactive matrices, cached until a matrix changes"""
+        if self.int_fk_cache is None:
+            rows = [[p["alpha"], p["a"], p["d"], p["theta"]] for p in self.int_params if any(p.values())]
+            numeric_rows = numeric_dh_rows(rows) if rows else None
+            if numeric_rows is not None:
+                # Fully numeric chain: evaluate with NumPy as the table tab does
+                self.int_fk_cache = reduce(np.matmul, [mDH_deg_numeric(*row) for row in numeric_rows])
+                return self.int_fk_cache
+            # Extend the surviving prefix products instead of multiplying the whole chain again
+            for i in range(len(self.int_prefix), len(self.int_params)):
+                Ti = self._int_matrix(i)
+                self.int_prefix.append(Ti if i == 0 else chain_product([self.int_prefix[-1], Ti]))
+            self.int_fk_cache = simplify_transform(self.int_prefix[-1]) if self.int_prefix else sp.eye(4)
+        return self.int_fk_cache
+    
     def _process_matrix_expression(self, expr, names):
         """Process matrix expression with transpose (^T) and inverse (^-1) operators"""
-        import re
-        
-        # Replace ^ operators: T01^T -> transpose, T01^-1 -> inverse, M0^T, m0^T, M0^-1, m0^-1, etc.
-        # Handle ^T (transpose) for both T/t-style (T01, t01, T12, t12) and M/m-style (M0, m0, M1, m1) matrices
-        expr_proc = re.sub(r'([TtMm]\d+)\^[Tt]', r'(\1.T)', expr)
-        # Handle ^-1 (inverse) for both T/t-style and M/m-style matrices
-        expr_proc = re.sub(r'([TtMm]\d+)\^-1', r'(\1)**(-1)', expr_proc)
-        # Handle ^-1 with parentheses: (expr)^-1
-        expr_proc = re.sub(r'\)(\^-1)', r')**(-1)', expr_proc)
-        # Handle ^T with parentheses: (expr)^T
-        expr_proc = re.sub(r'\)(\^[Tt])', r').T', expr_proc)
-        
-        # Evaluate the processed expression
-        result = eval(expr_proc, {"__builtins__": {}}, names)
-        return result
+        return run_matrix_expression(compile_matrix_expression(expr), names)
     
     def _int_write_output(self, text):
         """Write to interactive output"""
@@ -448,13 +954,15 @@ class DHCalculator(tk.Tk):
         self.tbl_entry_fields = []
         self.tbl_row_labels = []  # Store row labels for cleanup
         self.tbl_num_rows = 3
+        self._tbl_lock = threading.Lock()  # Calculations run on daemon threads, one at a time
+        self._tbl_job = None  # (future, cancel event) of the latest calculation
         
         # Instructions
         # Top frame
         top_frame = ttk.Frame(parent)
         top_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Label(top_frame, text="DH Parameters Table Input", font=("Arial", 10, "bold")).pack(anchor="w")
+        ttk.Label(top_frame, text="DH Parameters Table Input", font=self.font_bold).pack(anchor="w")
         
         # Table
         self.tbl_table_frame = ttk.Frame(top_frame)
@@ -463,7 +971,7 @@ class DHCalculator(tk.Tk):
         
         headers = ["Link", "α (Degree)", "a", "d", "θ (Degree)"]
         for col, header in enumerate(headers):
-            ttk.Label(table_frame, text=header, font=("Arial", 10, "bold"), relief="solid", borderwidth=1).grid(row=0, column=col, padx=5, pady=5, sticky="nsew")
+            ttk.Label(table_frame, text=header, font=self.font_bold, relief="solid", borderwidth=1).grid(row=0, column=col, padx=5, pady=5, sticky="nsew")
         
         self._tbl_create_rows(table_frame)
         
@@ -474,6 +982,7 @@ class DHCalculator(tk.Tk):
         ttk.Button(btn_frame, text="Add Row", command=lambda: self._tbl_add_row(table_frame)).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Remove Last Row", command=self._tbl_remove_row).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Calculate Forward Kinemtics", command=self._tbl_calculate).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self._tbl_cancel).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Clear All", command=self._tbl_clear).pack(side="left", padx=5)
         
         # Output
@@ -485,7 +994,7 @@ class DHCalculator(tk.Tk):
         clear_frame.pack(fill="x", pady=(0, 5))
         ttk.Button(clear_frame, text="Clear Results", command=lambda: self.tbl_output.delete("1.0", "end")).pack(anchor="e")
         
-        self.tbl_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=("Courier New", 10))
+        self.tbl_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=self.font_mono)
         self.tbl_output.pack(fill="both", expand=True)
         # Configure center alignment tag
         self.tbl_output.tag_configure("center", justify="center")
@@ -500,7 +1009,7 @@ class DHCalculator(tk.Tk):
             self.tbl_row_labels.append(label)
             row_entries = []
             for col in range(1, 5):
-                entry = ttk.Entry(parent, width=12, font=("Arial", 10))
+                entry = ttk.Entry(parent, width=12, font=self.font_normal)
                 entry.grid(row=row, column=col, padx=5, pady=5)
                 row_entries.append(entry)
             self.tbl_entry_fields.append(row_entries)
@@ -514,7 +1023,7 @@ class DHCalculator(tk.Tk):
         self.tbl_row_labels.append(label)
         row_entries = []
         for col in range(1, 5):
-            entry = ttk.Entry(parent, width=12, font=("Arial", 10))
+            entry = ttk.Entry(parent, width=12, font=self.font_normal)
             entry.grid(row=row, column=col, padx=5, pady=5)
             row_entries.append(entry)
         self.tbl_entry_fields.append(row_entries)
@@ -540,51 +1049,98 @@ class DHCalculator(tk.Tk):
         self._tbl_write_output("All cleared.\n\n")
     
     def _tbl_calculate(self):
-        """Calculate in table mode"""
+        """Start the table calculation on the worker thread"""
+        dh_rows = []
+        for row_entries in self.tbl_entry_fields:
+            if all(e.get().strip() == "" for e in row_entries):
+                continue
+            dh_rows.append([e.get().strip() for e in row_entries])
+        
+        if not dh_rows:
+            messagebox.showwarning("Empty", "Enter DH parameters first")
+            return
+        
+        if self._tbl_job is not None:
+            # A newer calculation supersedes the running one; its output is dropped
+            self._tbl_job[1].set()
+        cancel = threading.Event()
+        future = run_in_background(self._tbl_calculate_worker, dh_rows, cancel, lock=self._tbl_lock)
+        self._tbl_job = (future, cancel)
+        # The progress line is removed again if the calculation fails
+        self.tbl_output.mark_set("tbl_progress", "end-1c")
+        self.tbl_output.mark_gravity("tbl_progress", "left")
+        self._tbl_write_output("Calculating forward kinematics...\n")
+        self.after(50, self._tbl_poll, future, cancel)
+    
+    def _tbl_poll(self, future, cancel):
+        """Show the worker's output once it has finished"""
+        if not future.done():
+            self.after(50, self._tbl_poll, future, cancel)
+            return
+        if self._tbl_job is not None and self._tbl_job[0] is future:
+            self._tbl_job = None
+        if cancel.is_set():
+            return
+        
+        text, error = future.result()
+        if error is not None:
+            self.tbl_output.delete("tbl_progress", "end")
+            messagebox.showerror("Error", f"Calculation error: {error}")
+            return
+        self.tbl_output.delete("1.0", "end")
+        self._tbl_write_output(text)
+    
+    def _tbl_cancel(self):
+        """Cancel the running calculation; its output is dropped"""
+        if self._tbl_job is not None:
+            self._tbl_job[1].set()
+            self._tbl_job = None
+            self._tbl_write_output("Calculation cancelled.\n\n")
+    
+    def _tbl_calculate_worker(self, dh_rows, cancel):
+        """Run _tbl_compute off the Tk thread, returning its output text and any error"""
         try:
-            dh_params = []
-            for row_entries in self.tbl_entry_fields:
-                if all(e.get().strip() == "" for e in row_entries):
-                    continue
-                alpha, a, d, theta = [safe_sympify(e.get().strip()) for e in row_entries]
-                dh_params.append([alpha, a, d, theta])
-            
-            if not dh_params:
-                messagebox.showwarning("Empty", "Enter DH parameters first")
-                return
-            
-            self.tbl_output.delete("1.0", "end")
-            self._tbl_write_output("=" * 80 + "\n")
-            self._tbl_write_output("DH TRANSFORMATION MATRICES\n")
-            self._tbl_write_output("=" * 80 + "\n\n")
-            
-            matrices = []
-            for i, (alpha, a, d, theta) in enumerate(dh_params):
-                Ti = mDH_deg(alpha, a, d, theta)
-                Ti = sp.simplify(Ti)
-                matrices.append(Ti)
-                self._tbl_write_output(f"T{i}{i+1} =\n{pretty_matrix(Ti)}\n" + "-" * 80 + "\n")
-            
-            self._tbl_write_output("\n" + "=" * 80 + "\n")
-            self._tbl_write_output("FORWARD KINEMATICS T0N\n")
-            self._tbl_write_output("=" * 80 + "\n\n")
-            
-            forward = sp.eye(4)
-            for Ti in matrices:
-                forward = sp.simplify(forward * Ti)
-            
-            self._tbl_write_output("T0N =\n" + pretty_matrix(forward) + "\n\n")
-            
-            self._tbl_write_output("=" * 80 + "\nPOSITION VECTOR\n" + "=" * 80 + "\n\n")
-            self._tbl_write_output("p =\n")
-            self._tbl_write_output(pretty_vector(forward[:3, 3]) + "\n\n")
-            
-            self._tbl_write_output("=" * 80 + "\nROTATION MATRIX\n" + "=" * 80 + "\n\n")
-            self._tbl_write_output("R =\n")
-            self._tbl_write_output(pretty_matrix(forward[:3, :3]) + "\n\n")
-            
+            return self._tbl_compute(dh_rows, cancel), None
         except Exception as e:
-            messagebox.showerror("Error", f"Calculation error: {e}")
+            return None, e
+    
+    def _tbl_compute(self, dh_rows, cancel):
+        """Transforms and forward kinematics of the DH rows as output text (None once cancelled)"""
+        numeric_rows = numeric_dh_rows(dh_rows)
+        if numeric_rows is not None:
+            # Fully numeric table: evaluate with NumPy, no symbolic work at all
+            matrices = [mDH_deg_numeric(*row) for row in numeric_rows]
+            forward = reduce(np.matmul, matrices)
+        else:
+            # A single link has nothing left to simplify; only the product is simplified
+            matrices = [_mDH_cached(*row) for row in dh_rows]
+            if cancel.is_set():
+                return None
+            forward = _dh_forward(_dh_rows_sympy(dh_rows))
+        
+        buf = []  # Collected output, written to the widget in one insert
+        buf.append("=" * 80 + "\n")
+        buf.append("DH TRANSFORMATION MATRICES\n")
+        buf.append("=" * 80 + "\n\n")
+        
+        for i, Ti in enumerate(matrices):
+            buf.append(f"T{i}{i+1} =\n{pretty_matrix(Ti)}\n" + "-" * 80 + "\n")
+        
+        buf.append("\n" + "=" * 80 + "\n")
+        buf.append("FORWARD KINEMATICS T0N\n")
+        buf.append("=" * 80 + "\n\n")
+        
+        buf.append("T0N =\n" + pretty_cse(forward) + "\n\n")
+        
+        buf.append("=" * 80 + "\nPOSITION VECTOR\n" + "=" * 80 + "\n\n")
+        buf.append("p =\n")
+        buf.append(pretty_vector(forward[:3, 3:]) + "\n\n")
+        
+        buf.append("=" * 80 + "\nROTATION MATRIX\n" + "=" * 80 + "\n\n")
+        buf.append("R =\n")
+        buf.append(pretty_matrix(forward[:3, :3]) + "\n\n")
+        
+        return "".join(buf)
     
     def _tbl_write_output(self, text):
         """Write to table output"""
@@ -598,9 +1154,9 @@ class DHCalculator(tk.Tk):
         top_frame = ttk.Frame(parent)
         top_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Label(top_frame, text="Inverse Kinematics Problem Solver", font=("Arial", 10, "bold")).pack(anchor="w", pady=(0, 10))
+        ttk.Label(top_frame, text="Inverse Kinematics Problem Solver", font=self.font_bold).pack(anchor="w", pady=(0, 10))
         ttk.Label(top_frame, text="Instructions: Define DH parameters, specify end-effector pose (position & orientation), and solve for joint angles.", 
-                  font=("Arial", 10), foreground="gray").pack(anchor="w", pady=(0, 5))
+                  font=self.font_normal, foreground="gray").pack(anchor="w", pady=(0, 5))
         
         # Main container
         main = ttk.Frame(parent)
@@ -614,14 +1170,19 @@ class DHCalculator(tk.Tk):
         dh_frame.pack(fill="both", padx=0, pady=0)
         
         # DH table header
-        ttk.Label(dh_frame, text="Link", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        ttk.Label(dh_frame, text="α (deg)", font=("Arial", 10, "bold")).grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        ttk.Label(dh_frame, text="a", font=("Arial", 10, "bold")).grid(row=0, column=2, sticky="w", padx=5, pady=5)
-        ttk.Label(dh_frame, text="d", font=("Arial", 10, "bold")).grid(row=0, column=3, sticky="w", padx=5, pady=5)
-        ttk.Label(dh_frame, text="θ (var)", font=("Arial", 10, "bold")).grid(row=0, column=4, sticky="w", padx=5, pady=5)
+        ttk.Label(dh_frame, text="Link", font=self.font_bold).grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(dh_frame, text="α (deg)", font=self.font_bold).grid(row=0, column=1, sticky="w", padx=5, pady=5)
+        ttk.Label(dh_frame, text="a", font=self.font_bold).grid(row=0, column=2, sticky="w", padx=5, pady=5)
+        ttk.Label(dh_frame, text="d", font=self.font_bold).grid(row=0, column=3, sticky="w", padx=5, pady=5)
+        ttk.Label(dh_frame, text="θ (var)", font=self.font_bold).grid(row=0, column=4, sticky="w", padx=5, pady=5)
         
         self.ik_dh_entries = []
+        self.ik_dh_labels = []
+        self._ik_row_pool = []  # (label, entries) of removed rows, shown again by "Add Link"
         self.ik_num_links = tk.IntVar(value=3)
+        # Solves run on daemon threads, one at a time
+        self._ik_lock = threading.Lock()
+        self._ik_job = None  # (future, cancel event) of the latest solve
         
         for i in range(3):
             self._ik_add_dh_row(dh_frame, i)
@@ -636,32 +1197,32 @@ class DHCalculator(tk.Tk):
         target_frame = ttk.LabelFrame(left, text="Target End-Effector Pose", padding=10)
         target_frame.pack(fill="x", padx=0, pady=15)
         
-        ttk.Label(target_frame, text="Position (px, py, pz):", font=("Arial", 10, "bold")).pack(anchor="w", pady=(0, 5))
+        ttk.Label(target_frame, text="Position (px, py, pz):", font=self.font_bold).pack(anchor="w", pady=(0, 5))
         px_frame = ttk.Frame(target_frame)
         px_frame.pack(fill="x", pady=3)
         ttk.Label(px_frame, text="px:").pack(side="left", padx=5)
-        self.ik_px_entry = ttk.Entry(px_frame, width=15, font=("Arial", 10))
+        self.ik_px_entry = ttk.Entry(px_frame, width=15, font=self.font_normal)
         self.ik_px_entry.pack(side="left", padx=5)
         self.ik_px_entry.insert(0, "1")
         
         py_frame = ttk.Frame(target_frame)
         py_frame.pack(fill="x", pady=3)
         ttk.Label(py_frame, text="py:").pack(side="left", padx=5)
-        self.ik_py_entry = ttk.Entry(py_frame, width=15, font=("Arial", 10))
+        self.ik_py_entry = ttk.Entry(py_frame, width=15, font=self.font_normal)
         self.ik_py_entry.pack(side="left", padx=5)
         self.ik_py_entry.insert(0, "0.5")
         
         pz_frame = ttk.Frame(target_frame)
         pz_frame.pack(fill="x", pady=3)
         ttk.Label(pz_frame, text="pz:").pack(side="left", padx=5)
-        self.ik_pz_entry = ttk.Entry(pz_frame, width=15, font=("Arial", 10))
+        self.ik_pz_entry = ttk.Entry(pz_frame, width=15, font=self.font_normal)
         self.ik_pz_entry.pack(side="left", padx=5)
         self.ik_pz_entry.insert(0, "0.5")
         
-        ttk.Label(target_frame, text="Rotation Matrix (or Euler angles):", font=("Arial", 10, "bold")).pack(anchor="w", pady=(10, 5))
-        ttk.Label(target_frame, text="Enter 9 elements for R, or leave empty for identity", font=("Arial", 9), foreground="gray").pack(anchor="w")
+        ttk.Label(target_frame, text="Rotation Matrix (or Euler angles):", font=self.font_bold).pack(anchor="w", pady=(10, 5))
+        ttk.Label(target_frame, text="Enter 9 elements for R, or leave empty for identity", font=self.font_small, foreground="gray").pack(anchor="w")
         
-        self.ik_rot_entry = ttk.Entry(target_frame, width=30, font=("Arial", 10))
+        self.ik_rot_entry = ttk.Entry(target_frame, width=30, font=self.font_normal)
         self.ik_rot_entry.pack(fill="x", pady=3)
         self.ik_rot_entry.insert(0, "1,0,0,0,1,0,0,0,1")
         
@@ -673,7 +1234,17 @@ class DHCalculator(tk.Tk):
         btn_frame = ttk.Frame(right)
         btn_frame.pack(fill="x", pady=(0, 10))
         ttk.Button(btn_frame, text="Solve Inverse Kinematics", command=self._ik_solve).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self._ik_cancel).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Clear Results", command=self._ik_clear).pack(side="left", padx=5)
+        # Symbolic finds every closed-form solution; numeric returns one, much faster
+        self.ik_method = tk.StringVar(value="symbolic")
+        ttk.Radiobutton(btn_frame, text="Symbolic", variable=self.ik_method, value="symbolic").pack(side="left", padx=5)
+        ttk.Radiobutton(btn_frame, text="Numeric (fast)", variable=self.ik_method, value="numeric").pack(side="left", padx=5)
+        # Full sp.simplify of T0N is slow; by default only the trig rewrite is applied
+        self.ik_deep_simplify = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="Deep simplify", variable=self.ik_deep_simplify).pack(side="left", padx=5)
+        self.ik_real_joints = tk.BooleanVar(value=True)
+        ttk.Checkbutton(btn_frame, text="Real joint variables", variable=self.ik_real_joints).pack(side="left", padx=5)
         
         # Results display
         results_frame = ttk.LabelFrame(right, text="Solutions", padding=5)
@@ -684,22 +1255,17 @@ class DHCalculator(tk.Tk):
         ik_clear_frame.pack(fill="x", pady=(0, 5))
         ttk.Button(ik_clear_frame, text="Clear Results", command=lambda: self.ik_output.delete("1.0", "end")).pack(anchor="e")
         
-        self.ik_output = scrolledtext.ScrolledText(results_frame, height=30, wrap="word", font=("Courier New", 10))
+        self.ik_output = scrolledtext.ScrolledText(results_frame, height=30, wrap="word", font=self.font_mono)
         self.ik_output.pack(fill="both", expand=True)
-        self.ik_output.tag_configure("header", foreground="darkblue", font=("Courier New", 10, "bold"))
+        self.ik_output.tag_configure("header", foreground="darkblue", font=self.font_mono_bold)
         self.ik_output.tag_configure("solution", foreground="darkgreen")
+        self._ik_buf = []  # (text, tag) pairs waiting for the next flush
         
         self._ik_write_output(" inverse kinematics problems.\n\n", "header")
     
     def _ik_add_dh_row(self, parent, row_idx):
         """Add a DH parameter row"""
-        ttk.Label(parent, text=f"L{row_idx+1}").grid(row=row_idx+1, column=0, sticky="w", padx=5, pady=5)
-        
-        entries = []
-        for col in range(1, 5):
-            entry = ttk.Entry(parent, width=12, font=("Arial", 10))
-            entry.grid(row=row_idx+1, column=col, padx=5, pady=5)
-            entries.append(entry)
+        label, entries = self._ik_dh_row_widgets(parent, row_idx)
         
         # Set default values for a 3-link RR robot
         if row_idx == 0:
@@ -718,151 +1284,232 @@ class DHCalculator(tk.Tk):
             entries[2].insert(0, "0")
             entries[3].insert(0, "theta3")
         
+        self.ik_dh_labels.append(label)
         self.ik_dh_entries.append(entries)
     
+    def _ik_dh_row_widgets(self, parent, row_idx):
+        """Label and empty entries for DH row row_idx, reusing a removed row when possible"""
+        if self._ik_row_pool:
+            label, entries = self._ik_row_pool.pop()
+            for entry in entries:
+                entry.delete(0, "end")
+        else:
+            label = ttk.Label(parent, text=f"L{row_idx+1}")
+            entries = [ttk.Entry(parent, width=12, font=self.font_normal) for _ in range(4)]
+        
+        label.grid(row=row_idx+1, column=0, sticky="w", padx=5, pady=5)
+        for col, entry in enumerate(entries, 1):
+            entry.grid(row=row_idx+1, column=col, padx=5, pady=5)
+        return label, entries
+    
     def _ik_add_dh_row_dynamic(self, parent):
         """Add a new DH row dynamically"""
         row_idx = len(self.ik_dh_entries)
         
-        ttk.Label(parent, text=f"L{row_idx+1}").grid(row=row_idx+1, column=0, sticky="w", padx=5, pady=5)
-        
-        entries = []
-        for col in range(1, 5):
-            entry = ttk.Entry(parent, width=12, font=("Arial", 10))
-            entry.grid(row=row_idx+1, column=col, padx=5, pady=5)
-            entries.append(entry)
+        label, entries = self._ik_dh_row_widgets(parent, row_idx)
         
         entries[0].insert(0, "0")
         entries[1].insert(0, "1")
         entries[2].insert(0, "0")
         entries[3].insert(0, f"theta{row_idx+1}")
         
+        self.ik_dh_labels.append(label)
         self.ik_dh_entries.append(entries)
         self.ik_num_links.set(row_idx + 1)
     
     def _ik_remove_dh_row(self):
         """Remove last DH row"""
         if len(self.ik_dh_entries) > 1:
-            entries = self.ik_dh_entries.pop()
+            label, entries = self.ik_dh_labels.pop(), self.ik_dh_entries.pop()
+            label.grid_remove()
             for entry in entries:
-                entry.grid_forget()
+                entry.grid_remove()
+            self._ik_row_pool.append((label, entries))
             self.ik_num_links.set(len(self.ik_dh_entries))
     
     def _ik_solve(self):
-        """Solve inverse kinematics problem"""
+        """Start solving the inverse kinematics problem on the worker thread"""
+        # The worker only gets plain values; Tk is touched on this thread alone
+        params = {
+            "rows": [[e.get().strip() for e in entries] for entries in self.ik_dh_entries],
+            "p": (self.ik_px_entry.get(), self.ik_py_entry.get(), self.ik_pz_entry.get()),
+            "rot": self.ik_rot_entry.get().strip(),
+            "deep": self.ik_deep_simplify.get(),
+            "real": self.ik_real_joints.get(),
+            "method": self.ik_method.get(),
+        }
+        if self._ik_job is not None:
+            # A newer solve supersedes the running one; its output is dropped
+            self._ik_job[1].set()
+        cancel = threading.Event()
+        future = run_in_background(self._ik_solve_worker, params, cancel, lock=self._ik_lock)
+        self._ik_job = (future, cancel)
+        self._ik_write_output("Solving Inverse Kinematics...\n", "header")
+        self.after(50, self._ik_poll, future, cancel)
+    
+    def _ik_poll(self, future, cancel):
+        """Show the worker's output once it has finished"""
+        if not future.done():
+            self.after(50, self._ik_poll, future, cancel)
+            return
+        if self._ik_job is not None and self._ik_job[0] is future:
+            self._ik_job = None
+        if cancel.is_set():
+            return
+        
+        out, error = future.result()
+        for text, tag in out:
+            self._ik_write_output(text, tag)
+        if error is not None:
+            messagebox.showerror("Error", f"IK Calculation error: {error}")
+            self._ik_write_output(f"ERROR: {error}\n")
+    
+    def _ik_cancel(self):
+        """Cancel the running solve; it stops at its next checkpoint and its output is dropped"""
+        if self._ik_job is not None:
+            self._ik_job[1].set()
+            self._ik_job = None
+            self._ik_write_output("Solve cancelled.\n\n", "header")
+    
+    def _ik_solve_worker(self, params, cancel):
+        """Run _ik_compute off the Tk thread, returning its output as (text, tag) pairs and any error"""
+        out = []
         try:
-            self._ik_write_output("Solving Inverse Kinematics...\n", "header")
-            self._ik_write_output("=" * 80 + "\n\n")
-            
-            # Parse DH parameters
-            dh_params = []
-            theta_vars = []
-            for entries in self.ik_dh_entries:
-                alpha = safe_sympify(entries[0].get().strip())
-                a = safe_sympify(entries[1].get().strip())
-                d = safe_sympify(entries[2].get().strip())
-                theta_expr = entries[3].get().strip()
-                theta_sym = sp.Symbol(theta_expr)
-                theta_vars.append(theta_sym)
-                dh_params.append([alpha, a, d, theta_sym])
-            
-            # Build forward kinematics T0N
-            self._ik_write_output("Step 1: Forward Kinematics (Symbolic)\n")
-            self._ik_write_output("-" * 80 + "\n\n")
-            
-            T0N = sp.eye(4)
-            for i, (alpha, a, d, theta) in enumerate(dh_params):
-                Ti = mDH_deg(alpha, a, d, theta)
-                T0N = sp.simplify(T0N * Ti)
-                self._ik_write_output(f"T{i}{i+1} computed...\n")
-            
-            self._ik_write_output(f"\nT0N (first 2 rows):\n")
-            self._ik_write_output(str(T0N[:2, :]) + "\n\n")
-            
-            # Parse target pose
-            self._ik_write_output("Step 2: Target End-Effector Pose\n")
-            self._ik_write_output("-" * 80 + "\n\n")
-            
-            px = float(self.ik_px_entry.get().strip())
-            py = float(self.ik_py_entry.get().strip())
-            pz = float(self.ik_pz_entry.get().strip())
-            
-            self._ik_write_output(f"Position: p = [{px}, {py}, {pz}]ᵀ\n\n")
-            
-            # Create target transformation matrix
-            target_R_str = self.ik_rot_entry.get().strip()
-            if target_R_str and target_R_str != "":
-                try:
-                    rot_vals = [float(x.strip()) for x in target_R_str.split(",")]
-                    if len(rot_vals) == 9:
-                        target_R = sp.Matrix(3, 3, rot_vals)
-                    else:
-                        self._ik_write_output("Warning: Invalid rotation matrix (need 9 values). Using identity.\n")
-                        target_R = sp.eye(3)
-                except:
-                    self._ik_write_output("Warning: Could not parse rotation matrix. Using identity.\n")
-                    target_R = sp.eye(3)
+            self._ik_compute(params, cancel, lambda text, tag="": out.append((text, tag)))
+        except Exception as e:
+            return out, e
+        return out, None
+    
+    def _ik_compute(self, params, cancel, write):
+        """Inverse kinematics computation; checks cancel between the expensive steps"""
+        write("=" * 80 + "\n\n")
+        
+        # Parse DH parameters
+        dh_params = []
+        # Real joint variables let solve discard complex branches (real=None adds no assumption)
+        theta_names = [row[3] for row in params["rows"]]
+        # One Symbol per row: sp.symbols would split "theta 1" and expand ranges such as "q1:3"
+        theta_vars = [sp.Symbol(name, real=params["real"] or None) for name in theta_names]
+        for row, theta_sym in zip(params["rows"], theta_vars):
+            alpha, a, d = (_cached_sympify(s) for s in row[:3])
+            dh_params.append((alpha, a, d, theta_sym))
+        # Angle symbols enter cos/sin radian-valued (see degree_argument); printed expressions
+        # and solutions substitute them back so every shown angle is in degrees
+        angle_symbols = set(theta_vars).union(*(alpha.free_symbols for alpha, *_ in dh_params))
+        to_radians = radians_substitution(angle_symbols)
+        
+        # Build forward kinematics T0N
+        write("Step 1: Forward Kinematics (Symbolic)\n")
+        write("-" * 80 + "\n\n")
+        
+        dh_params = tuple(dh_params)
+        for i in range(len(dh_params)):
+            if cancel.is_set():
+                return
+            # Each prefix extends the cached one before it
+            _dh_chain(dh_params[:i + 1])
+            write(f"T{i}{i+1} computed...\n")
+        
+        if cancel.is_set():
+            return
+        T0N = _ik_forward(dh_params, params["deep"])
+        
+        write(f"\nT0N (first 2 rows):\n")
+        write(str(T0N[:2, :].xreplace(to_radians)) + "\n\n")
+        
+        # Parse target pose
+        write("Step 2: Target End-Effector Pose\n")
+        write("-" * 80 + "\n\n")
+        
+        px, py, pz = (float(v.strip()) for v in params["p"])
+        
+        write(f"Position: p = [{px}, {py}, {pz}]ᵀ\n\n")
+        
+        # Create target transformation matrix
+        target_R_str = params["rot"]
+        if target_R_str and target_R_str != "":
+            rot_match = _RE_ROT9.fullmatch(target_R_str)
+            if rot_match:
+                target_R = sp.Matrix(3, 3, [float(g) for g in rot_match.groups()])
             else:
+                write("Warning: Invalid rotation matrix (need 9 comma-separated numbers). Using identity.\n")
                 target_R = sp.eye(3)
+        else:
+            target_R = sp.eye(3)
+        
+        target_T = target_R.row_join(sp.Matrix([px, py, pz])).col_join(sp.Matrix([[0, 0, 0, 1]]))
+        
+        write("Target Transformation Matrix:\n")
+        write(pretty_matrix(target_T) + "\n\n")
+        
+        # Set up equations: position constraints
+        write("Step 3: Solving Equations\n")
+        write("-" * 80 + "\n\n")
+        
+        px_expr = T0N[0, 3]
+        py_expr = T0N[1, 3]
+        pz_expr = T0N[2, 3]
+        
+        # solve treats each expression as expr = 0, so no Eq nodes are needed
+        equations = [px_expr - px, py_expr - py, pz_expr - pz]
+        
+        write(f"Position Equations:\n")
+        write(f"  x: {px_expr.xreplace(to_radians)} = {px}\n")
+        write(f"  y: {py_expr.xreplace(to_radians)} = {py}\n")
+        write(f"  z: {pz_expr.xreplace(to_radians)} = {pz}\n\n")
+        
+        # Attempt to solve
+        write("Solving system of equations...\n\n")
+        if cancel.is_set():
+            return
+        
+        if params["method"] == "numeric":
+            self._ik_solve_numeric((px_expr, py_expr, pz_expr), (px, py, pz), theta_vars, write)
+            write("=" * 80 + "\n")
+            return
+        
+        try:
+            solutions = planar_ik(dh_params, (px, py, pz), target_R)
+            if solutions is None:
+                solutions = sp.solve(equations, theta_vars, dict=True, simplify=False, rational=False)
+                # The solver works in the radian-valued angle symbols; report degrees,
+                # evaluated when the angle is a plain number (188.49/pi -> 60.0)
+                solutions = [{var: _degrees_value(val.xreplace(to_radians) * 180 / sp.pi)
+                              for var, val in sol.items()}
+                             for sol in solutions]
             
-            target_T = sp.Matrix([
-                [target_R[0, 0], target_R[0, 1], target_R[0, 2], px],
-                [target_R[1, 0], target_R[1, 1], target_R[1, 2], py],
-                [target_R[2, 0], target_R[2, 1], target_R[2, 2], pz],
-                [0, 0, 0, 1]
-            ])
-            
-            self._ik_write_output("Target Transformation Matrix:\n")
-            self._ik_write_output(pretty_matrix(target_T) + "\n\n")
-            
-            # Set up equations: position constraints
-            self._ik_write_output("Step 3: Solving Equations\n")
-            self._ik_write_output("-" * 80 + "\n\n")
-            
-            px_expr = T0N[0, 3]
-            py_expr = T0N[1, 3]
-            pz_expr = T0N[2, 3]
-            
-            equations = [
-                sp.Eq(px_expr, px),
-                sp.Eq(py_expr, py),
-                sp.Eq(pz_expr, pz)
-            ]
-            
-            self._ik_write_output(f"Position Equations:\n")
-            self._ik_write_output(f"  x: {px_expr} = {px}\n")
-            self._ik_write_output(f"  y: {py_expr} = {py}\n")
-            self._ik_write_output(f"  z: {pz_expr} = {pz}\n\n")
-            
-            # Attempt to solve
-            self._ik_write_output("Solving system of equations...\n\n")
+            if not solutions:
+                write("No analytical solution found.\n")
+                write("Note: Some problems may require numerical methods.\n", "solution")
+                return
             
-            try:
-                solutions = sp.solve(equations, theta_vars, dict=True)
-                
-                if not solutions:
-                    self._ik_write_output("No analytical solution found.\n")
-                    self._ik_write_output("Note: Some problems may require numerical methods.\n", "solution")
-                    return
-                
-                self._ik_write_output(f"Found {len(solutions)} solution(s):\n\n", "header")
-                
-                for sol_idx, sol in enumerate(solutions, 1):
-                    self._ik_write_output(f"Solution {sol_idx}:\n", "solution")
-                    self._ik_write_output("-" * 40 + "\n")
-                    for var, val in sol.items():
-                        self._ik_write_output(f"  {var} = {val}\n", "solution")
-                    self._ik_write_output("\n")
-                
-            except Exception as solve_error:
-                self._ik_write_output(f"Symbolic solver encountered issue: {solve_error}\n")
-                self._ik_write_output("Try numerical approach or simplify problem.\n", "solution")
+            write(f"Found {len(solutions)} solution(s):\n\n", "header")
             
-            self._ik_write_output("=" * 80 + "\n")
+            for sol_idx, sol in enumerate(solutions, 1):
+                write(f"Solution {sol_idx}:\n", "solution")
+                write("-" * 40 + "\n")
+                for var, val in sol.items():
+                    write(f"  {var} = {val}\n", "solution")
+                write("\n")
             
-        except Exception as e:
-            messagebox.showerror("Error", f"IK Calculation error: {e}")
-            self._ik_write_output(f"ERROR: {e}\n")
+        except Exception as solve_error:
+            write(f"Symbolic solver encountered issue: {solve_error}\n")
+            write("Try numerical approach or simplify problem.\n", "solution")
+        
+        write("=" * 80 + "\n")
+    
+    def _ik_solve_numeric(self, position, target, theta_vars, write):
+        """Solve the position equations numerically and write the result"""
+        result = solve_numeric_ik(position, target, theta_vars)
+        if result is None:
+            write("No numeric solution found (target may be out of reach).\n")
+            return
+        
+        q, err = result
+        write("Numeric solution:\n\n", "header")
+        for var, val in zip(theta_vars, q):
+            write(f"  {var} = {format_number(val)}°\n", "solution")
+        write(f"\n  residual |F| = {err:.3g}\n\n")
     
     def _ik_clear(self):
         """Clear inverse kinematics output"""
@@ -870,12 +1517,8 @@ class DHCalculator(tk.Tk):
         self._ik_write_output("Cleared.\n\n", "header")
     
     def _ik_write_output(self, text, tag=""):
-        """Write to IK output"""
-        if tag:
-            self.ik_output.insert("end", text, tag)
-        else:
-            self.ik_output.insert("end", text)
-        self.ik_output.see("end")
+        """Write to IK output (buffered until Tk is idle)"""
+        self._buffer_output(self.ik_output, self._ik_buf, text, tag)
     
     # ============== TAB 4: MATRIX CALCULATOR ==============
     def _build_matrix_calculator_tab(self, parent):
@@ -905,7 +1548,10 @@ class DHCalculator(tk.Tk):
         list_frame = ttk.LabelFrame(left, text="Matrices", padding=10)
         list_frame.pack(fill="y", padx=0, pady=0)
         
-        self.mc_listbox = tk.Listbox(list_frame, height=16, width=15, font=("Courier", 10, "bold"))
+        # Item labels live in a list variable so a re-label is one Tk call
+        self.mc_list_var = tk.StringVar(value=())
+        self.mc_listbox = tk.Listbox(list_frame, listvariable=self.mc_list_var, height=16, width=15,
+                                     font=self.font_mono_bold)
         self.mc_listbox.pack(fill="y", expand=False)
         self.mc_listbox.bind("<<ListboxSelect>>", self._mc_on_select)
         
@@ -913,19 +1559,19 @@ class DHCalculator(tk.Tk):
         editor = ttk.LabelFrame(left, text="Matrix Input", padding=10)
         editor.pack(fill="x", pady=15)
         
-        self.mc_sel_label = ttk.Label(editor, text="Selected: -", font=("Arial", 10, "bold"), foreground="darkblue")
+        self.mc_sel_label = ttk.Label(editor, text="Selected: -", font=self.font_bold, foreground="darkblue")
         self.mc_sel_label.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 15))
         
         # Dimension inputs with better layout
         dim_frame = ttk.Frame(editor)
         dim_frame.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(0, 15))
         
-        ttk.Label(dim_frame, text="Rows:", font=("Arial", 10)).pack(side="left", padx=(0, 5))
-        self.mc_rows_entry = ttk.Entry(dim_frame, width=6, font=("Arial", 10))
+        ttk.Label(dim_frame, text="Rows:", font=self.font_normal).pack(side="left", padx=(0, 5))
+        self.mc_rows_entry = ttk.Entry(dim_frame, width=6, font=self.font_normal)
         self.mc_rows_entry.pack(side="left", padx=(0, 15))
         
-        ttk.Label(dim_frame, text="Cols:", font=("Arial", 10)).pack(side="left", padx=(0, 5))
-        self.mc_cols_entry = ttk.Entry(dim_frame, width=6, font=("Arial", 10))
+        ttk.Label(dim_frame, text="Cols:", font=self.font_normal).pack(side="left", padx=(0, 5))
+        self.mc_cols_entry = ttk.Entry(dim_frame, width=6, font=self.font_normal)
         self.mc_cols_entry.pack(side="left", padx=(0, 10))
         
         ttk.Button(dim_frame, text="Create Grid", command=self._mc_create_grid, width=15).pack(side="left")
@@ -934,6 +1580,8 @@ class DHCalculator(tk.Tk):
         self.mc_grid_frame = ttk.Frame(editor)
         self.mc_grid_frame.grid(row=2, column=0, columnspan=3, sticky="nsew", pady=(0, 15), padx=5)
         self.mc_grid_entries = []
+        self._mc_grid_pool = []  # Every Entry ever created for the grid, reused on resize
+        self._mc_grid_shape = (0, 0)  # Rows/columns currently given grid weight
         
         # Action buttons
         btn_frame1 = ttk.Frame(editor)
@@ -947,13 +1595,16 @@ class DHCalculator(tk.Tk):
         ops = ttk.LabelFrame(right, text="Operations & Expression", padding=10)
         ops.pack(fill="x")
         
-        ttk.Label(ops, text="Format: M0*M1, M0^T (transpose), M0^-1 (inverse), etc.", font=("Arial", 9), foreground="gray").pack(anchor="w", pady=(0, 10))
+        ttk.Label(ops, text="Format: M0*M1, M0^T (transpose), M0^-1 (inverse), etc.", font=self.font_small, foreground="gray").pack(anchor="w", pady=(0, 10))
         
         expr_frame = ttk.Frame(ops)
         expr_frame.pack(fill="x", pady=10)
         ttk.Label(expr_frame, text="Expression:").pack(anchor="w")
-        self.mc_expr_entry = ttk.Entry(expr_frame, width=50, font=("Arial", 10))
+        self.mc_expr_entry = ttk.Entry(expr_frame, width=50, font=self.font_normal)
         self.mc_expr_entry.pack(fill="x", pady=(0, 5))
+        # sp.simplify grows quickly with expression size, so symbolic results are shown as computed by default
+        self.mc_simplify_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(expr_frame, text="Simplify result", variable=self.mc_simplify_var).pack(anchor="w")
         ttk.Button(expr_frame, text="Run Operation", command=self._mc_run_operation).pack(anchor="e")
         
         # Output
@@ -965,9 +1616,10 @@ class DHCalculator(tk.Tk):
         mc_clear_frame.pack(fill="x", pady=(0, 5))
         ttk.Button(mc_clear_frame, text="Clear Results", command=lambda: self.mc_output.delete("1.0", "end")).pack(anchor="e")
         
-        self.mc_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=("Courier New", 10))
+        self.mc_output = scrolledtext.ScrolledText(out_frame, height=25, wrap="word", font=self.font_mono)
         self.mc_output.pack(fill="both", expand=True)
         self.mc_output.tag_configure("center", justify="center")
+        self._mc_buf = []
         
         self._mc_write_output("Matrix Calculator\n\n")
     
@@ -980,24 +1632,24 @@ class DHCalculator(tk.Tk):
         dialog.transient(self)
         dialog.grab_set()
         
-        ttk.Label(dialog, text="Enter matrix dimensions:", font=("Arial", 10, "bold")).pack(pady=10)
+        ttk.Label(dialog, text="Enter matrix dimensions:", font=self.font_bold).pack(pady=10)
         
         # Rows and Cols input
         dim_frame = ttk.Frame(dialog)
         dim_frame.pack(fill="x", padx=20, pady=5)
         
-        ttk.Label(dim_frame, text="Rows:", font=("Arial", 9)).pack(side="left", padx=(0, 5))
-        rows_entry = ttk.Entry(dim_frame, width=5, font=("Arial", 10))
+        ttk.Label(dim_frame, text="Rows:", font=self.font_small).pack(side="left", padx=(0, 5))
+        rows_entry = ttk.Entry(dim_frame, width=5, font=self.font_normal)
         rows_entry.pack(side="left", padx=(0, 20))
         rows_entry.insert(0, "4")
         
-        ttk.Label(dim_frame, text="Cols:", font=("Arial", 9)).pack(side="left", padx=(0, 5))
-        cols_entry = ttk.Entry(dim_frame, width=5, font=("Arial", 10))
+        ttk.Label(dim_frame, text="Cols:", font=self.font_small).pack(side="left", padx=(0, 5))
+        cols_entry = ttk.Entry(dim_frame, width=5, font=self.font_normal)
         cols_entry.pack(side="left")
         cols_entry.insert(0, "4")
         
         # Grid container frame
-        grid_label = ttk.Label(dialog, text="Matrix values:", font=("Arial", 10, "bold"))
+        grid_label = ttk.Label(dialog, text="Matrix values:", font=self.font_bold)
         grid_label.pack(pady=(15, 5))
         
         grid_container = ttk.Frame(dialog)
@@ -1023,7 +1675,7 @@ class DHCalculator(tk.Tk):
                 for r in range(rows):
                     row_entries = []
                     for c in range(cols):
-                        entry = ttk.Entry(grid_container, width=8, font=("Arial", 10))
+                        entry = ttk.Entry(grid_container, width=8, font=self.font_normal)
                         entry.grid(row=r, column=c, padx=2, pady=2, sticky="nsew")
                         entry.insert(0, "0")
                         row_entries.append(entry)
@@ -1053,12 +1705,12 @@ class DHCalculator(tk.Tk):
                         val = entry.get().strip()
                         if not val:
                             raise ValueError("Grid contains empty cells")
-                        row_values.append(safe_sympify(val))
+                        row_values.append(_cached_sympify(val))
                     matrix_data.append(row_values)
                 
                 # Create the matrix
                 idx = len(self.mc_matrices)
-                M = sp.Matrix(matrix_data)
+                M = make_matrix(matrix_data)
                 self.mc_matrices.append(M)
                 
                 name = f"M{idx}"
@@ -1120,32 +1772,34 @@ class DHCalculator(tk.Tk):
                 messagebox.showerror("Invalid", "Rows and Columns must be >= 1")
                 return
             
-            # Clear existing grid - destroy all widgets in frame
-            for widget in self.mc_grid_frame.winfo_children():
-                widget.destroy()
+            # Create only the entries the pool is missing and hide the surplus
+            needed = rows * cols
+            while len(self._mc_grid_pool) < needed:
+                self._mc_grid_pool.append(ttk.Entry(self.mc_grid_frame, width=10, font=self.font_normal))
+            for entry in self._mc_grid_pool[needed:]:
+                entry.grid_remove()
             self.mc_grid_entries = []
             
-            # Reset grid configuration
-            for i in range(10):  # Reset up to 10 rows
-                self.mc_grid_frame.grid_rowconfigure(i, weight=0)
-            for j in range(10):  # Reset up to 10 columns
-                self.mc_grid_frame.grid_columnconfigure(j, weight=0)
-            
-            # Create new grid
+            # Lay out the pooled entries as the new grid
             for r in range(rows):
-                row_entries = []
-                for c in range(cols):
-                    entry = ttk.Entry(self.mc_grid_frame, width=10, font=("Arial", 10))
-                    entry.grid(row=r, column=c, padx=3, pady=3, sticky="nsew")
+                row_entries = self._mc_grid_pool[r * cols:(r + 1) * cols]
+                for c, entry in enumerate(row_entries):
+                    entry.delete(0, "end")
                     entry.insert(0, "0")
-                    row_entries.append(entry)
+                    entry.grid(row=r, column=c, padx=3, pady=3, sticky="nsew")
                 self.mc_grid_entries.append(row_entries)
             
-            # Configure grid weight
-            for r in range(rows):
+            # Configure grid weight, touching only the rows/columns that appeared or went away
+            prev_rows, prev_cols = self._mc_grid_shape
+            for r in range(rows, prev_rows):
+                self.mc_grid_frame.grid_rowconfigure(r, weight=0)
+            for r in range(prev_rows, rows):
                 self.mc_grid_frame.grid_rowconfigure(r, weight=1)
-            for c in range(cols):
+            for c in range(cols, prev_cols):
+                self.mc_grid_frame.grid_columnconfigure(c, weight=0)
+            for c in range(prev_cols, cols):
                 self.mc_grid_frame.grid_columnconfigure(c, weight=1)
+            self._mc_grid_shape = (rows, cols)
             
         except ValueError:
             messagebox.showerror("Error", "Enter valid row and column numbers")
@@ -1175,10 +1829,10 @@ class DHCalculator(tk.Tk):
                     val = entry.get().strip()
                     if not val:
                         raise ValueError("Grid contains empty cells")
-                    row_values.append(safe_sympify(val))
+                    row_values.append(_cached_sympify(val))
                 matrix_data.append(row_values)
             
-            M = sp.Matrix(matrix_data)
+            M = make_matrix(matrix_data)
             self.mc_matrices[idx] = M
             self.mc_names[f"M{idx}"] = M
             
@@ -1214,18 +1868,12 @@ class DHCalculator(tk.Tk):
             sel = (0,)
         
         idx = int(sel[0])
-        self.mc_listbox.delete(idx)
         self.mc_matrices.pop(idx)
         
-        # Rebuild names dict with new indices
-        self.mc_names = {}
-        for i, M in enumerate(self.mc_matrices):
-            self.mc_names[f"M{i}"] = M
-        
-        # Update listbox
-        self.mc_listbox.delete(0, "end")
-        for i in range(len(self.mc_matrices)):
-            self.mc_listbox.insert("end", f"M{i}")
+        # Only the matrices after the deleted one change name; the list is set in one Tk call
+        labels = self.mc_listbox.get(0, "end")[:idx] + tuple(f"M{i}" for i in range(idx, len(self.mc_matrices)))
+        self.mc_list_var.set(labels)
+        self.mc_names = dict(zip(labels, self.mc_matrices))
         
         self.mc_sel_label.config(text="Selected: -")
         self._mc_write_output(f"✓ Matrix deleted. Remaining matrices re-indexed.\n\n")
@@ -1235,6 +1883,7 @@ class DHCalculator(tk.Tk):
         if messagebox.askyesno("Confirm", "Clear all matrices?"):
             self.mc_matrices = []
             self.mc_names = {}
+            _cached_sympify.cache_clear()
             self.mc_listbox.delete(0, "end")
             self.mc_sel_label.config(text="Selected: -")
             self.mc_output.delete("1.0", "end")
@@ -1242,13 +1891,21 @@ class DHCalculator(tk.Tk):
     
     def _mc_parse_matrix(self, text_content):
         """Parse matrix from text content"""
+        # Plain float content is tokenized by numpy in one pass; integer-only content
+        # has no decimal point or exponent and stays exact through make_matrix below
+        if _RE_FLOAT_MARK.search(text_content):
+            try:
+                return np.loadtxt(io.StringIO(text_content), delimiter=",", ndmin=2)
+            except ValueError:
+                pass
+        
         lines = text_content.strip().split("\n")
         matrix_data = []
         
         for line in lines:
             if line.strip():
                 # Split by comma and parse each element
-                elements = [safe_sympify(e.strip()) for e in line.split(",")]
+                elements = [_cached_sympify(e.strip()) for e in line.split(",")]
                 matrix_data.append(elements)
         
         if not matrix_data:
@@ -1260,7 +1917,7 @@ class DHCalculator(tk.Tk):
             if len(row) != col_count:
                 raise ValueError(f"Row has {len(row)} columns, expected {col_count}")
         
-        return sp.Matrix(matrix_data)
+        return make_matrix(matrix_data)
     
     def _mc_run_operation(self):
         """Run operation with expression"""
@@ -1281,8 +1938,12 @@ class DHCalculator(tk.Tk):
             result = self._process_matrix_expression(expr, names)
             
             self._mc_write_output(f"\n{expr} =\n")
-            if isinstance(result, sp.MatrixBase):
-                self._mc_write_output(pretty_matrix(sp.simplify(result)) + "\n\n")
+            if isinstance(result, np.ndarray):
+                self._mc_write_output(pretty_matrix(result) + "\n\n")
+            elif isinstance(result, sp.MatrixBase):
+                if self.mc_simplify_var.get():
+                    result = sp.simplify(result)
+                self._mc_write_output(pretty_matrix(result) + "\n\n")
             else:
                 self._mc_write_output(f"{result}\n\n")
         except Exception as e:
@@ -1299,9 +1960,9 @@ class DHCalculator(tk.Tk):
         
         # Instructions
         ttk.Label(dialog, text="Enter DH Parameters to generate transformation matrices", 
-                  font=("Arial", 10, "bold")).pack(pady=10)
+                  font=self.font_bold).pack(pady=10)
         ttk.Label(dialog, text="Each row: α (deg), a, d, θ (deg) Write t,T,Theta,a,A,Alpha for symbols", 
-                  font=("Arial", 9), foreground="gray").pack(pady=(0, 10))
+                  font=self.font_small, foreground="gray").pack(pady=(0, 10))
         
         # Table container frame (takes up middle space)
         table_container = ttk.Frame(dialog)
@@ -1327,7 +1988,7 @@ class DHCalculator(tk.Tk):
         # Headers
         headers = ["Link", "α (Degree)", "a", "d", "θ (Degree)"]
         for col, header in enumerate(headers):
-            ttk.Label(table_frame, text=header, font=("Arial", 10, "bold"), 
+            ttk.Label(table_frame, text=header, font=self.font_bold, 
                      relief="solid", borderwidth=1).grid(row=0, column=col, padx=5, pady=5, sticky="nsew")
         
         # Create entry fields (5 rows initially)
@@ -1338,12 +1999,12 @@ class DHCalculator(tk.Tk):
             """Create DH parameter entry rows"""
             for i in range(num_rows):
                 row_entries = []
-                link_label = ttk.Label(table_frame, text=str(i+1), font=("Arial", 10, "bold"))
+                link_label = ttk.Label(table_frame, text=str(i+1), font=self.font_bold)
                 link_label.grid(row=i+1, column=0, padx=5, pady=5, sticky="nsew")
                 row_labels.append(link_label)
                 
                 for col in range(4):
-                    entry = ttk.Entry(table_frame, width=12, font=("Arial", 10))
+                    entry = ttk.Entry(table_frame, width=12, font=self.font_normal)
                     entry.grid(row=i+1, column=col+1, padx=5, pady=5, sticky="nsew")
                     entry.insert(0, "0")
                     row_entries.append(entry)
@@ -1362,12 +2023,12 @@ class DHCalculator(tk.Tk):
             """Add a new row to the DH table"""
             i = len(dh_entries)
             row_entries = []
-            link_label = ttk.Label(table_frame, text=str(i+1), font=("Arial", 10, "bold"))
+            link_label = ttk.Label(table_frame, text=str(i+1), font=self.font_bold)
             link_label.grid(row=i+1, column=0, padx=5, pady=5, sticky="nsew")
             row_labels.append(link_label)
             
             for col in range(4):
-                entry = ttk.Entry(table_frame, width=12, font=("Arial", 10))
+                entry = ttk.Entry(table_frame, width=12, font=self.font_normal)
                 entry.grid(row=i+1, column=col+1, padx=5, pady=5, sticky="nsew")
                 entry.insert(0, "0")
                 row_entries.append(entry)
@@ -1395,10 +2056,10 @@ class DHCalculator(tk.Tk):
                     if all(e.get().strip() == "" for e in row_entries):
                         continue
                     
-                    alpha = safe_sympify(row_entries[0].get().strip())
-                    a = safe_sympify(row_entries[1].get().strip())
-                    d = safe_sympify(row_entries[2].get().strip())
-                    theta = safe_sympify(row_entries[3].get().strip())
+                    alpha = _cached_sympify(row_entries[0].get().strip())
+                    a = _cached_sympify(row_entries[1].get().strip())
+                    d = _cached_sympify(row_entries[2].get().strip())
+                    theta = _cached_sympify(row_entries[3].get().strip())
                     
                     dh_params.append([alpha, a, d, theta])
                 
@@ -1409,9 +2070,8 @@ class DHCalculator(tk.Tk):
                 # Generate transformation matrices
                 matrices = []
                 for i, (alpha, a, d, theta) in enumerate(dh_params):
-                    Ti = mDH_deg(alpha, a, d, theta)
-                    Ti = sp.simplify(Ti)
-                    matrices.append(Ti)
+                    # A single link is already in simplest form; copy it out of the mDH_deg cache
+                    matrices.append(sp.Matrix(mDH_deg(alpha, a, d, theta)))
                 
                 # Add matrices to matrix calculator
                 start_idx = len(self.mc_matrices)
@@ -1451,12 +2111,25 @@ class DHCalculator(tk.Tk):
         dialog.focus()
     
     def _mc_write_output(self, text, tag=""):
-        """Write to matrix calculator output"""
-        if tag:
-            self.mc_output.insert("end", text, tag)
-        else:
-            self.mc_output.insert("end", text)
-        self.mc_output.see("end")
+        """Write to matrix calculator output (buffered until Tk is idle)"""
+        self._buffer_output(self.mc_output, self._mc_buf, text, tag)
+    
+    def _buffer_output(self, widget, buf, text, tag):
+        """Queue text for widget; the first queued piece schedules a single flush"""
+        if not buf:
+            self.after_idle(self._flush_output, widget, buf)
+        buf.append((text, tag))
+    
+    def _flush_output(self, widget, buf):
+        """Insert all queued text with one Tk call, merging runs that share a tag"""
+        if not buf:
+            return
+        args = []
+        for tag, run in groupby(buf, key=itemgetter(1)):
+            args += ["".join(text for text, _ in run), tag]
+        buf.clear()
+        widget.insert("end", *args)
+        widget.see("end")
 
 
 if __name__ == "__main__":